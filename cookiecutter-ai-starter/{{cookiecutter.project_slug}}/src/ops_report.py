@@ -336,6 +336,7 @@ def build_ops_report_data(
         violations_by_pipeline[pipeline_name] = violations_by_pipeline.get(pipeline_name, 0) + 1
 
     top_alert_types = _collect_top_alert_types(Path(logs_dir) / "alerts.log", since=window_start, top_n=3)
+    top_alert_type_counts = {item["type"]: item["count"] for item in top_alert_types}
     daily_alert_summaries = _collect_daily_alert_summaries(Path(logs_dir), since=window_start, limit=7)
     failed_command_retry_guides = _collect_failed_command_retry_guides(Path(logs_dir), since=window_start, limit=12)
     artifact_integrity = _load_artifact_integrity(Path(logs_dir))
@@ -355,6 +356,7 @@ def build_ops_report_data(
         "threshold_violations_count": len(violations),
         "threshold_violations_by_pipeline": violations_by_pipeline,
         "top_alert_types": top_alert_types,
+        "top_alert_type_counts": top_alert_type_counts,
         "daily_alert_summaries": daily_alert_summaries,
         "artifact_integrity": artifact_integrity,
         "recent_command_failures": recent_command_failures,
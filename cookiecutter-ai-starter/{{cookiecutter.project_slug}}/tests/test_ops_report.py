@@ -156,10 +156,7 @@ def test_build_ops_report_data_aggregates_metrics_alerts_and_failures(tmp_path):
     assert report["pipeline_success_rates"]["weekly"]["success_rate"] == 1.0
     assert report["threshold_violations_count"] >= 2
 
-    top_types = {item["type"]: item["count"] for item in report["top_alert_types"]}
-    assert top_types.get("command_failed", 0) == 1
-    assert top_types.get("threshold", 0) == 1
-    assert top_types.get("webhook_failed", 0) == 1
+    assert report["top_alert_type_counts"] == {"command_failed": 1, "threshold": 1, "webhook_failed": 1}
     assert len(report["daily_alert_summaries"]) == 1
     assert report["daily_alert_summaries"][0]["date"] == "2026-03-01"
     assert report["daily_alert_summaries"][0]["command_failures"] == 1
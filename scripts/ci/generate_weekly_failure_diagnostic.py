@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable
 
 DEFAULT_REQUIRED_FILES = (
     "docs/ops_reports/latest_ops_report.md",
@@ -21,7 +22,7 @@ DEFAULT_COMMANDS = (
 )
 
 
-def missing_required_files(required_files: list[str], root: Path) -> list[str]:
+def missing_required_files(required_files: Iterable[str], root: Path) -> list[str]:
     return [path for path in required_files if not (root / path).is_file()]
 
 
@@ -17,6 +17,10 @@ PATTERNS = {
     "slack_webhook": re.compile(r"https://hooks\.slack\.com/services/[A-Za-z0-9/_-]+"),
 }
 
+# Any-pattern prefilter: one pass rejects clean files and lines before the
+# per-pattern checks that name each finding.
+COMBINED_PATTERN = re.compile("|".join(f"(?:{pattern.pattern})" for pattern in PATTERNS.values()))
+
 ALLOWLIST_REGEX = [
     re.compile(r"\bsk-\.\.\.\b"),
     re.compile(r"\byour_api_key_here\b", re.IGNORECASE),
@@ -70,8 +74,11 @@ def scan_paths(paths: Iterable[Path], root: Path) -> list[dict[str, str | int]]:
         except OSError:
             continue
 
+        if not COMBINED_PATTERN.search(content):
+            continue
+
         for index, line in enumerate(content.splitlines(), start=1):
-            if _is_allowlisted(line):
+            if not COMBINED_PATTERN.search(line) or _is_allowlisted(line):
                 continue
             for pattern_name, pattern in PATTERNS.items():
                 if pattern.search(line):
@@ -6,7 +6,12 @@ import os
 from pathlib import Path
 import re
 import sys
-from src import models
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
 from src.collector import DataCollector
 from src.analyzer import (
     load_entries,
@@ -57,6 +62,13 @@ def _extract_period_key_from_monthly_report(markdown_text: str) -> str:
     return match.group(1).strip()
 
 
+def _emit_json(payload: object) -> None:
+    if orjson is not None:
+        print(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode("utf-8"))
+    else:
+        print(json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+
+
 def handle_collect(args: list[str]) -> None:
     """Collect information and persist it.
 
@@ -479,7 +491,7 @@ def handle_metrics_summary(args: list[str]) -> None:
     summary = build_metrics_summary(days=days)
 
     if "--json" in args:
-        print(json.dumps(summary, ensure_ascii=False))
+        _emit_json(summary)
     else:
         print(format_metrics_summary_text(summary))
 
@@ -504,17 +516,14 @@ def handle_metrics_check(args: list[str]) -> bool:
     has_failure = bool(violations) or continuous_severity == "critical"
 
     if "--json" in args:
-        print(
-            json.dumps(
-                {
-                    "schema_version": SCHEMA_VERSION,
-                    "days": days,
-                    "threshold_profile": threshold_profile,
-                    "violations": violations,
-                    "continuous_alert": continuous_alert,
-                },
-                ensure_ascii=False,
-            )
+        _emit_json(
+            {
+                "schema_version": SCHEMA_VERSION,
+                "days": days,
+                "threshold_profile": threshold_profile,
+                "violations": violations,
+                "continuous_alert": continuous_alert,
+            }
         )
     else:
         print(f"Metric threshold profile: {threshold_profile}")
@@ -584,7 +593,7 @@ def handle_ops_report(args: list[str]) -> None:
         },
     )
     if emit_json:
-        print(json.dumps(report, ensure_ascii=False))
+        _emit_json(report)
     else:
         print(f"Updated: {report_path}")
 
@@ -624,7 +633,7 @@ def handle_alert_dedup_status(args: list[str]) -> None:
 
     summary = summarize_alert_dedup_state(state_path, top_n=top_n)
     if emit_json:
-        print(json.dumps(summary, ensure_ascii=False))
+        _emit_json(summary)
         return
 
     print(f"Alert dedup state: {summary['state_path']}")
@@ -657,7 +666,7 @@ def handle_alert_dedup_reset(args: list[str]) -> None:
 
     result = reset_alert_dedup_state(state_path, backup=backup)
     if emit_json:
-        print(json.dumps(result, ensure_ascii=False))
+        _emit_json(result)
         return
 
     print("Alert dedup state reset completed.")
@@ -690,7 +699,7 @@ def handle_alert_dedup_prune(args: list[str]) -> None:
 
     result = prune_alert_dedup_state(state_path, ttl_sec=ttl_sec)
     if emit_json:
-        print(json.dumps(result, ensure_ascii=False))
+        _emit_json(result)
         return
 
     print("Alert dedup prune completed.")
@@ -701,6 +710,48 @@ def handle_alert_dedup_prune(args: list[str]) -> None:
     print(f"Removed: {result['removed_count']}")
 
 
+def handle_metrics_check_command(args: list[str]) -> None:
+    has_violations = handle_metrics_check(args)
+    if has_violations:
+        raise SystemExit(1)
+
+
+def handle_doctor(args: list[str]) -> None:
+    if "--json" in args:
+        print_doctor_report_json()
+    else:
+        print_doctor_report()
+
+
+def handle_env_init(_: list[str]) -> None:
+    result = ensure_env_from_example()
+    if result["missing_example"]:
+        print(".env.example not found.")
+    else:
+        print(f".env initialized. created={result['created']} added={result['added']}")
+
+
+COMMAND_HANDLERS = {
+    "collect": handle_collect,
+    "analyze": handle_analyze,
+    "fetch": handle_fetch,
+    "apply-insights": handle_apply_insights,
+    "weekly-report": handle_weekly_report,
+    "monthly-report": handle_monthly_report,
+    "retention": handle_retention,
+    "retention-run": handle_retention,
+    "metrics-summary": handle_metrics_summary,
+    "metrics-check": handle_metrics_check_command,
+    "ops-report": handle_ops_report,
+    "ops-report-index": handle_ops_report_index,
+    "alert-dedup-status": handle_alert_dedup_status,
+    "alert-dedup-reset": handle_alert_dedup_reset,
+    "alert-dedup-prune": handle_alert_dedup_prune,
+    "doctor": handle_doctor,
+    "env-init": handle_env_init,
+}
+
+
 def main():
     # command dispatching comes first so that the collector can be used
     # without an API key at all.
@@ -719,62 +770,9 @@ def main():
         if cmd in {"-h", "--help", "help"}:
             print_main_usage()
             return
-        if cmd == "collect":
-            handle_collect(sys.argv[2:])
-            return
-        elif cmd == "analyze":
-            handle_analyze(sys.argv[2:])
-            return
-        elif cmd == "fetch":
-            handle_fetch(sys.argv[2:])
-            return
-        elif cmd == "apply-insights":
-            handle_apply_insights(sys.argv[2:])
-            return
-        elif cmd == "weekly-report":
-            handle_weekly_report(sys.argv[2:])
-            return
-        elif cmd == "monthly-report":
-            handle_monthly_report(sys.argv[2:])
-            return
-        elif cmd in {"retention", "retention-run"}:
-            handle_retention(sys.argv[2:])
-            return
-        elif cmd == "metrics-summary":
-            handle_metrics_summary(sys.argv[2:])
-            return
-        elif cmd == "metrics-check":
-            has_violations = handle_metrics_check(sys.argv[2:])
-            if has_violations:
-                raise SystemExit(1)
-            return
-        elif cmd == "ops-report":
-            handle_ops_report(sys.argv[2:])
-            return
-        elif cmd == "ops-report-index":
-            handle_ops_report_index(sys.argv[2:])
-            return
-        elif cmd == "alert-dedup-status":
-            handle_alert_dedup_status(sys.argv[2:])
-            return
-        elif cmd == "alert-dedup-reset":
-            handle_alert_dedup_reset(sys.argv[2:])
-            return
-        elif cmd == "alert-dedup-prune":
-            handle_alert_dedup_prune(sys.argv[2:])
-            return
-        elif cmd == "doctor":
-            if "--json" in sys.argv[2:]:
-                print_doctor_report_json()
-            else:
-                print_doctor_report()
-            return
-        elif cmd == "env-init":
-            result = ensure_env_from_example()
-            if result["missing_example"]:
-                print(".env.example not found.")
-            else:
-                print(f".env initialized. created={result['created']} added={result['added']}")
+        handler = COMMAND_HANDLERS.get(cmd)
+        if handler:
+            handler(sys.argv[2:])
             return
 
         if cmd:
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 import json
 import os
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
 
 _ALLOWED_PIPELINES = {"daily", "weekly", "monthly"}
@@ -434,7 +434,7 @@ def summarize_pipeline_metrics(days: int = 30, logs_dir: str | Path = "logs") ->
 
 def calculate_operational_health_score(
     summary: Mapping[str, Any],
-    violations: list[Mapping[str, Any]] | None = None,
+    violations: Sequence[Mapping[str, Any]] | None = None,
 ) -> dict[str, Any]:
     """Calculate a single operational health score (0-100) from recent metrics.
 
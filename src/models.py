@@ -1,7 +1,18 @@
 """Model handling utilities."""
-from openai import OpenAI
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 
 def get_openai_client(api_key: str) -> OpenAI:
-    """Return an OpenAI client configured with the given API key."""
+    """Return an OpenAI client configured with the given API key.
+
+    ``openai`` is imported on first use so commands that never call the
+    API do not pay for loading it.
+    """
+    from openai import OpenAI
+
     return OpenAI(api_key=api_key)
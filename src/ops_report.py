@@ -19,9 +19,12 @@ from src.ops_report_index import write_ops_reports_index
 
 
 _PIPELINE_RUN_LOG_PATTERN = re.compile(r"^(daily|weekly|monthly)-run-(\d{8})-(\d{6})\.log$")
+# Matched against a whole run log with ``finditer``; ``[^\S\n]`` keeps every
+# match on a single line.
 _FAILED_COMMAND_PATTERN = re.compile(
-    r"^\[(?P<timestamp>[^\]]+)\]\s+ERROR\s+(?P<pipeline>daily|weekly|monthly)\s+pipeline:\s+command failed:\s+(?P<command>.+)$",
-    re.IGNORECASE,
+    r"^[^\S\n]*\[(?P<timestamp>[^\]\n]+)\][^\S\n]+ERROR[^\S\n]+(?P<pipeline>daily|weekly|monthly)"
+    r"[^\S\n]+pipeline:[^\S\n]+command failed:[^\S\n]+(?P<command>.+)$",
+    re.IGNORECASE | re.MULTILINE,
 )
 _RUNBOOK_HEADING_PATTERN = re.compile(r"^#{1,6}\s+(?P<heading>.+?)\s*$")
 
@@ -165,6 +168,42 @@ def _build_runbook_reference_parts(pipeline: str) -> tuple[str, str]:
     return f"{runbook_path}{anchor}", anchor
 
 
+def _parse_run_log_failures(
+    path: Path, pipeline_from_name: str, file_ts: datetime, since: datetime
+) -> list[dict[str, Any]]:
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return []
+
+    rows: list[dict[str, Any]] = []
+    for parsed in _FAILED_COMMAND_PATTERN.finditer(text):
+        failed_command = parsed.group("command").strip()
+        if not failed_command:
+            continue
+
+        pipeline_name = parsed.group("pipeline").strip().lower() or pipeline_from_name
+        event_ts = file_ts
+        ts_text = parsed.group("timestamp").strip()
+        if ts_text:
+            try:
+                candidate = datetime.fromisoformat(ts_text)
+                event_ts = _to_naive_utc(candidate)
+            except ValueError:
+                event_ts = file_ts
+        if event_ts < since:
+            continue
+
+        rows.append(
+            {
+                "event_ts": event_ts,
+                "pipeline": pipeline_name,
+                "failed_command": failed_command,
+            }
+        )
+    return rows
+
+
 def _collect_failed_command_retry_guides(logs_dir: Path, since: datetime, limit: int = 12) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
     for path in sorted(logs_dir.glob("*-run-*.log"), reverse=True):
@@ -181,39 +220,7 @@ def _collect_failed_command_retry_guides(logs_dir: Path, since: datetime, limit:
             continue
         if file_ts < since:
             continue
-
-        try:
-            lines = path.read_text(encoding="utf-8").splitlines()
-        except OSError:
-            continue
-
-        for line in lines:
-            parsed = _FAILED_COMMAND_PATTERN.match(line.strip())
-            if not parsed:
-                continue
-            failed_command = parsed.group("command").strip()
-            if not failed_command:
-                continue
-
-            pipeline_name = parsed.group("pipeline").strip().lower() or pipeline_from_name
-            event_ts = file_ts
-            ts_text = parsed.group("timestamp").strip()
-            if ts_text:
-                try:
-                    candidate = datetime.fromisoformat(ts_text)
-                    event_ts = _to_naive_utc(candidate)
-                except ValueError:
-                    event_ts = file_ts
-            if event_ts < since:
-                continue
-
-            rows.append(
-                {
-                    "event_ts": event_ts,
-                    "pipeline": pipeline_name,
-                    "failed_command": failed_command,
-                }
-            )
+        rows.extend(_parse_run_log_failures(path, pipeline_from_name, file_ts, since))
 
     rows.sort(key=lambda item: item.get("event_ts", datetime.min), reverse=True)
 
@@ -336,6 +343,7 @@ def build_ops_report_data(
         violations_by_pipeline[pipeline_name] = violations_by_pipeline.get(pipeline_name, 0) + 1
 
     top_alert_types = _collect_top_alert_types(Path(logs_dir) / "alerts.log", since=window_start, top_n=3)
+    top_alert_type_counts = {item["type"]: item["count"] for item in top_alert_types}
     daily_alert_summaries = _collect_daily_alert_summaries(Path(logs_dir), since=window_start, limit=7)
     failed_command_retry_guides = _collect_failed_command_retry_guides(Path(logs_dir), since=window_start, limit=12)
     artifact_integrity = _load_artifact_integrity(Path(logs_dir))
@@ -355,6 +363,7 @@ def build_ops_report_data(
         "threshold_violations_count": len(violations),
         "threshold_violations_by_pipeline": violations_by_pipeline,
         "top_alert_types": top_alert_types,
+        "top_alert_type_counts": top_alert_type_counts,
         "daily_alert_summaries": daily_alert_summaries,
         "artifact_integrity": artifact_integrity,
         "recent_command_failures": recent_command_failures,
@@ -6,6 +6,14 @@ from pathlib import Path
 from datetime import date
 
 
+_CANDIDATE_ACTION_LINES = (
+    "- [ ] Add or refine template modules based on top recurring theme",
+    "- [ ] Expand test cases for pain points found in collected notes",
+    "- [ ] Update README quickstart to address top confusion areas",
+    "- [ ] Add one automation script that removes manual repetitive setup",
+)
+
+
 def _priority_rank(action_text: str) -> int:
     if action_text.startswith("[High]"):
         return 0
@@ -54,10 +62,7 @@ def generate_backlog_markdown(
         lines.append("- [ ] No spotlight actions extracted yet")
     lines.append("")
     lines.append("## Candidate Actions")
-    lines.append("- [ ] Add or refine template modules based on top recurring theme")
-    lines.append("- [ ] Expand test cases for pain points found in collected notes")
-    lines.append("- [ ] Update README quickstart to address top confusion areas")
-    lines.append("- [ ] Add one automation script that removes manual repetitive setup")
+    lines.extend(_CANDIDATE_ACTION_LINES)
     lines.append("")
     return "\n".join(lines)
 
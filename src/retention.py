@@ -11,6 +11,9 @@ import re
 import shutil
 
 
+_ALERT_TIMESTAMP_PATTERN = re.compile(r"^\[([^\]]+)\]")
+
+
 def _parse_iso_timestamp(value: str | None) -> datetime | None:
     if not value:
         return None
@@ -73,6 +76,18 @@ def _rewrite_lines(path: Path, lines: list[str]) -> None:
             f.write("\n".join(lines) + "\n")
 
 
+def _scan_metrics_files(logs_dir: Path) -> list[os.DirEntry[str]]:
+    """Return ``*-metrics-*.json`` files in ``logs_dir`` sorted by name."""
+    with os.scandir(logs_dir) as entries:
+        matches = [
+            entry
+            for entry in entries
+            if entry.name.endswith(".json") and "-metrics-" in entry.name[:-5] and entry.is_file()
+        ]
+    matches.sort(key=lambda entry: entry.name)
+    return matches
+
+
 def _archive_date(now: datetime) -> str:
     return now.strftime("%Y%m%d")
 
@@ -82,6 +97,7 @@ def run_retention(base_dir: Path | str = ".") -> dict[str, Any]:
     now = datetime.now()
     days = _retention_days()
     cutoff = now - timedelta(days=days)
+    cutoff_ts = cutoff.timestamp()
     archive_dir = root / "archive"
     archive_tag = _archive_date(now)
 
@@ -144,10 +160,10 @@ def run_retention(base_dir: Path | str = ".") -> dict[str, Any]:
     if alerts_path.exists():
         kept_lines: list[str] = []
         moved_lines: list[str] = []
-        pattern = re.compile(r"^\[([^\]]+)\]")
         with alerts_path.open("r", encoding="utf-8") as f:
-            for raw_line in f.read().splitlines():
-                match = pattern.match(raw_line)
+            for raw_line in f:
+                raw_line = raw_line.rstrip("\n")
+                match = _ALERT_TIMESTAMP_PATTERN.match(raw_line)
                 timestamp = _parse_iso_timestamp(match.group(1)) if match else None
                 if timestamp and timestamp < cutoff:
                     moved_lines.append(raw_line)
@@ -165,14 +181,15 @@ def run_retention(base_dir: Path | str = ".") -> dict[str, Any]:
     metrics_archive_dir = archive_dir / "metrics"
     logs_dir = root / "logs"
     if logs_dir.exists():
-        for metrics_path in sorted(logs_dir.glob("*-metrics-*.json")):
+        for entry in _scan_metrics_files(logs_dir):
+            metrics_path = Path(entry.path)
             try:
-                modified_at = datetime.fromtimestamp(metrics_path.stat().st_mtime)
+                modified_ts = entry.stat().st_mtime
             except OSError:
                 metrics_kept += 1
                 continue
 
-            if modified_at < cutoff:
+            if modified_ts < cutoff_ts:
                 metrics_archive_dir.mkdir(parents=True, exist_ok=True)
                 destination = metrics_archive_dir / metrics_path.name
                 if destination.exists():
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 import json
 from pathlib import Path
 import re
@@ -26,11 +27,12 @@ def load_json_schema(schema_path: str | Path) -> dict[str, Any]:
 
 def validate_json_payload(payload: Any, schema: dict[str, Any], *, schema_name: str = "schema") -> None:
     validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda err: list(err.path))
-    if not errors:
+    # Only the error at the smallest path is reported, so pick it in one pass
+    # instead of sorting every error.
+    first = min(validator.iter_errors(payload), key=lambda err: list(err.path), default=None)
+    if first is None:
         return
 
-    first = errors[0]
     path = ".".join(str(item) for item in first.path)
     location = path or "<root>"
     raise ValueError(f"JSON schema validation failed ({schema_name}) at {location}: {first.message}")
@@ -67,6 +69,13 @@ def _extract_supported_schema_versions(schema: dict[str, Any]) -> list[str]:
     return []
 
 
+@lru_cache(maxsize=64)
+def _supported_schema_majors(supported_versions: tuple[str, ...]) -> frozenset[int]:
+    # Keyed on the version strings rather than the schema dict, which is
+    # unhashable and may be mutated by callers.
+    return frozenset(_parse_semver(version)[0] for version in supported_versions)
+
+
 def validate_schema_version_compatibility(
     payload: Any,
     schema: dict[str, Any],
@@ -94,12 +103,7 @@ def validate_schema_version_compatibility(
             f"schema_version compatibility check failed: no schema_version const/enum defined in {schema_name}"
         )
 
-    supported_majors: set[int] = set()
-    for supported_version in supported_versions:
-        major, _, _ = _parse_semver(supported_version)
-        supported_majors.add(major)
-
-    if payload_major not in supported_majors:
+    if payload_major not in _supported_schema_majors(tuple(supported_versions)):
         raise ValueError(
             "schema_version compatibility check failed: "
             f"major version mismatch (payload={payload_schema_version}, supported={supported_versions})"
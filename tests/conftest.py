@@ -0,0 +1,257 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import lru_cache
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+from jsonschema import Draft202012Validator
+
+from src import main
+from src.schema_validation import load_json_schema
+
+
+DEFAULT_ENTRIES = [{"source": "s", "content": "c"}]
+DEFAULT_SUMMARY = {"s": 1}
+
+
+def _stub_load_entries():
+    return DEFAULT_ENTRIES
+
+
+def _stub_summarize_by_source(entries):
+    return DEFAULT_SUMMARY
+
+
+def _stub_no_actions(markdown_text):
+    return []
+
+
+def _stub_write_backlog(summary, ai_summary="", **kwargs):
+    return "docs/improvement_backlog.md"
+
+
+def _stub_update_instruction_file(top_sources):
+    return ".github/instructions/common.instructions.md"
+
+
+def _stub_sync_promoted_actions(*args, **kwargs):
+    return {"created": 0, "skipped_existing": 0}
+
+
+DEFAULT_MAIN_STUBS = {
+    "load_entries": _stub_load_entries,
+    "summarize_by_source": _stub_summarize_by_source,
+    "extract_spotlight_action_items_from_markdown": _stub_no_actions,
+    "extract_promoted_actions_from_markdown": _stub_no_actions,
+    "write_backlog": _stub_write_backlog,
+    "update_instruction_file": _stub_update_instruction_file,
+    "sync_promoted_actions_to_github_issues": _stub_sync_promoted_actions,
+}
+
+
+@pytest.fixture
+def main_stubs(monkeypatch):
+    """Patch the default apply-insights stubs into ``src.main``.
+
+    Tests override individual stubs with ``monkeypatch.setattr`` afterwards.
+    """
+    patch_many(monkeypatch, main, DEFAULT_MAIN_STUBS)
+    return DEFAULT_MAIN_STUBS
+
+
+@pytest.fixture
+def apply_insights_env(main_stubs, monkeypatch, tmp_path):
+    """Run ``handle_apply_insights`` in ``tmp_path`` with default stubs."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+LATEST_REPORT_TEMPLATES = {
+    "weekly": (
+        "docs/weekly_reports/latest_weekly_report.md",
+        "# Weekly Report (2026-W09)\n\n## Action Items\n- [ ] [Promoted] Do X\n",
+    ),
+    "weekly_unlabeled": (
+        "docs/weekly_reports/latest_weekly_report.md",
+        "## Action Items\n- [ ] [Promoted] Do X\n",
+    ),
+    "monthly": (
+        "docs/monthly_reports/latest_monthly_report.md",
+        "# Monthly Report (2026-02)\n\n## Promotable Actions\n- [ ] [Promoted] Do monthly X\n",
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def latest_report_templates(tmp_path_factory):
+    """Write each latest-report tree once per session."""
+    root = tmp_path_factory.mktemp("latest_reports")
+    for name, (relative_path, content) in LATEST_REPORT_TEMPLATES.items():
+        path = root / name / relative_path
+        fast_write(path, content)
+    return root
+
+
+@pytest.fixture
+def install_latest_reports(latest_report_templates, tmp_path):
+    """Copy the named latest-report templates into ``tmp_path``."""
+
+    def install(*names):
+        for name in names:
+            shutil.copytree(latest_report_templates / name, tmp_path, dirs_exist_ok=True)
+
+    return install
+
+
+GITHUB_SYNC_ENV = {
+    "AUTO_SYNC_PROMOTED_ISSUES": "1",
+    "GITHUB_REPO": "owner/repo",
+    "GITHUB_TOKEN": "token",
+}
+
+
+GITHUB_ISSUE_OPTION_ENV = (
+    "GITHUB_ISSUE_PERIOD_LABELS",
+    "GITHUB_ISSUE_LABELS",
+    "GITHUB_ISSUE_ASSIGNEES",
+    "GITHUB_ISSUE_ASSIGNEE_RULES",
+    "PROMOTED_MIN_COUNT",
+)
+
+
+@pytest.fixture
+def github_sync_env(monkeypatch):
+    """Enable promoted-action issue sync against a dummy repository.
+
+    Optional issue settings inherited from the host environment are cleared.
+    """
+    for name in GITHUB_ISSUE_OPTION_ENV:
+        monkeypatch.delenv(name, raising=False)
+    set_envs(monkeypatch, **GITHUB_SYNC_ENV)
+    return GITHUB_SYNC_ENV
+
+
+def set_envs(monkeypatch, **envs):
+    """Apply several ``monkeypatch.setenv`` calls at once."""
+    for name, value in envs.items():
+        monkeypatch.setenv(name, value)
+
+
+@contextmanager
+def argv_as(argv):
+    """Temporarily replace ``sys.argv`` with a copy of ``argv``."""
+    saved = sys.argv
+    sys.argv = list(argv)
+    try:
+        yield
+    finally:
+        sys.argv = saved
+
+
+def patch_many(monkeypatch, target, attrs):
+    """Apply several ``monkeypatch.setattr`` calls on ``target`` at once.
+
+    Use this rather than ``unittest.mock.patch.multiple`` so the patches share
+    monkeypatch's undo stack with the rest of the test.
+    """
+    for name, value in attrs.items():
+        monkeypatch.setattr(target, name, value)
+
+
+def fast_write(path, text):
+    """Write UTF-8 ``text`` to ``path`` with a single ``os.write``, creating parents."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, text.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+# Metrics scenarios are written relative to a fixed clock; test_metrics
+# freezes ``src.metrics.datetime.now`` to the same instant.
+FROZEN_NOW = datetime(2026, 3, 1, 0, 0, 0)
+
+
+def _metric(pipeline, finished_at, duration_sec, command_failures, alert_count, success):
+    """Return a pipeline metrics record already serialized to JSON bytes."""
+    payload = {
+        "pipeline": pipeline,
+        "finished_at": finished_at.isoformat(),
+        "duration_sec": duration_sec,
+        "command_failures": command_failures,
+        "alert_count": alert_count,
+        "success": success,
+    }
+    return json.dumps(payload).encode("utf-8")
+
+
+METRIC_SCENARIOS = {
+    "basic": {
+        "daily-metrics-20260301-010101.json": _metric("daily", FROZEN_NOW - timedelta(days=1), 10, 1, 2, True),
+        "daily-metrics-20260301-020202.json": _metric("daily", FROZEN_NOW, 20, 0, 1, False),
+        "weekly-metrics-20260301-030303.json": _metric("weekly", FROZEN_NOW, 30, 2, 3, True),
+    },
+    "days_filter": {
+        "monthly-metrics-20260301-040404.json": _metric("monthly", FROZEN_NOW - timedelta(days=1), 44, 1, 1, True),
+        "monthly-metrics-20260101-040404.json": _metric("monthly", FROZEN_NOW - timedelta(days=40), 99, 9, 9, False),
+    },
+    "daily_failure": {
+        "daily-metrics-20260301-000001.json": _metric("daily", FROZEN_NOW, 12, 0, 0, False),
+    },
+    "daily_failure_with_alerts": {
+        "daily-metrics-20260301-000001.json": _metric("daily", FROZEN_NOW, 12, 1, 2, False),
+    },
+    "weekly_streak": {
+        f"weekly-metrics-20260301-00000{offset}.json": _metric(
+            "weekly", FROZEN_NOW - timedelta(hours=offset), 10, 1, 1, False
+        )
+        for offset in range(3)
+    },
+    "daily_streak": {
+        f"daily-metrics-20260301-01010{offset}.json": _metric(
+            "daily", FROZEN_NOW - timedelta(hours=offset), 8, 1, 1, False
+        )
+        for offset in range(5)
+    },
+    "empty": {},
+}
+
+
+@pytest.fixture(scope="session")
+def metrics_logs_dir(tmp_path_factory):
+    """Write each metrics scenario once per session into its own subdirectory.
+
+    Tests pick a scenario with ``metrics_logs_dir / "<name>"`` and must not
+    modify it.
+    """
+    root = tmp_path_factory.mktemp("metrics_logs")
+    for scenario, files in METRIC_SCENARIOS.items():
+        scenario_dir = root / scenario
+        scenario_dir.mkdir()
+        for name, blob in files.items():
+            (scenario_dir / name).write_bytes(blob)
+    return root
+
+
+SCHEMA_DIR = Path(__file__).resolve().parents[1] / "docs" / "schemas"
+
+
+@lru_cache(maxsize=None)
+def load_schema(name: str) -> dict:
+    """Load and check ``docs/schemas/<name>`` once per test session."""
+    return load_json_schema(SCHEMA_DIR / name)
+
+
+@lru_cache(maxsize=None)
+def schema_validator(name: str) -> Draft202012Validator:
+    """Build the validator for ``docs/schemas/<name>`` once per test session."""
+    return Draft202012Validator(load_schema(name))
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from src import analyzer
+from src import analyzer, main
 
 
 def test_load_entries_nonexistent(tmp_path: Path):
@@ -33,6 +33,7 @@ def test_summarize_and_pretty_print(capsys: pytest.CaptureFixture):
     assert "b: 1" in captured.out
 
 
+@pytest.mark.xdist_group("logs")
 def test_analyze_cli(monkeypatch, capsys, tmp_path: Path):
     # Prepare a fake data file
     path = tmp_path / "collected_data.json"
@@ -40,10 +41,8 @@ def test_analyze_cli(monkeypatch, capsys, tmp_path: Path):
     path.write_text(json.dumps(data))
 
     # monkeypatch the function used by main (it was imported directly)
-    from src import main
     monkeypatch.setattr(main, "load_entries", lambda p=None: data)
 
-    from src import main
     monkeypatch.setenv("OPENAI_API_KEY", "ignored")
     monkeypatch.setattr(sys, "argv", ["prog", "analyze"])
     main.main()
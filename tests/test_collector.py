@@ -3,6 +3,7 @@ from pathlib import Path
 
 import pytest
 
+from src import main
 from src.collector import DataCollector
 
 
@@ -52,10 +53,9 @@ def test_collect_skips_duplicate_entries(tmp_path: Path):
     assert len(data) == 1
 
 
+@pytest.mark.xdist_group("logs")
 def test_handle_collect_cli(monkeypatch, tmp_path: Path, capsys):
     # simulate running main.handle_collect via sys.argv style
-    from src import main
-
     storage = tmp_path / "cli.json"
     # monkeypatch DataCollector to use our temporary path
     class DummyCollector:
@@ -1,6 +1,8 @@
 from pathlib import Path
 import json
 
+import pytest
+
 from src import connectors
 
 
@@ -18,6 +20,7 @@ class DummyResponse:
         return self._payload
 
 
+@pytest.mark.xdist_group("logs")
 def test_fetch_github_issues(monkeypatch):
     payload = [
         {"title": "Issue A", "body": "Body A", "html_url": "https://example/a"},
@@ -34,6 +37,7 @@ def test_fetch_github_issues(monkeypatch):
     assert "Issue A" in entries[0]["content"]
 
 
+@pytest.mark.xdist_group("logs")
 def test_fetch_rss_feed(monkeypatch):
     xml = """
     <rss><channel>
@@ -62,6 +66,7 @@ def test_fetch_survey_json(tmp_path: Path):
     assert entries[0]["source"] == "survey"
 
 
+@pytest.mark.xdist_group("logs")
 def test_fetch_github_issues_retries(monkeypatch):
     payload = [{"title": "Issue A", "body": "Body A", "html_url": "https://example/a"}]
     calls = {"count": 0}
@@ -127,6 +132,7 @@ def test_fetch_github_updates_meta_on_200(monkeypatch, tmp_path: Path):
     assert "accessed_at" in saved[key]
 
 
+@pytest.mark.xdist_group("logs")
 def test_fetch_github_waits_on_429_retry_after(monkeypatch):
     responses = iter(
         [
@@ -147,6 +153,7 @@ def test_fetch_github_waits_on_429_retry_after(monkeypatch):
     assert sleeps == [7.0]
 
 
+@pytest.mark.xdist_group("logs")
 def test_fetch_github_waits_on_remaining_zero_with_reset(monkeypatch):
     responses = iter(
         [
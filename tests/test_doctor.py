@@ -1,5 +1,6 @@
+import orjson
+
 from src import doctor
-import json
 
 
 def test_run_doctor_reports_errors_for_invalid_values(monkeypatch):
@@ -34,7 +35,7 @@ def test_doctor_json_ok_with_warnings_when_fail_on_warnings_unset(monkeypatch, c
     monkeypatch.setenv("AUTO_SYNC_PROMOTED_ISSUES", "0")
 
     doctor.print_doctor_report_json()
-    payload = json.loads(capsys.readouterr().out)
+    payload = orjson.loads(capsys.readouterr().out)
 
     assert payload["errors"] == []
     assert len(payload["warnings"]) >= 1
@@ -53,7 +54,7 @@ def test_doctor_json_not_ok_with_warnings_when_fail_on_warnings_enabled(monkeypa
     monkeypatch.setenv("AUTO_SYNC_PROMOTED_ISSUES", "0")
 
     doctor.print_doctor_report_json()
-    payload = json.loads(capsys.readouterr().out)
+    payload = orjson.loads(capsys.readouterr().out)
 
     assert payload["errors"] == []
     assert len(payload["warnings"]) >= 1
@@ -69,10 +70,12 @@ def test_run_doctor_reports_errors_for_invalid_pipeline_common_parameters(monkey
 
     result = doctor.run_doctor()
 
-    assert "ALERT_WEBHOOK_RETRIES must be >= 1" in result["errors"]
-    assert "ALERT_WEBHOOK_BACKOFF_SEC must be >= 0.1" in result["errors"]
-    assert "ALERT_DEDUP_COOLDOWN_SEC must be >= 0" in result["errors"]
-    assert "CONNECTOR_MAX_WAIT_SEC must be >= 0" in result["errors"]
+    assert {
+        "ALERT_WEBHOOK_RETRIES must be >= 1",
+        "ALERT_WEBHOOK_BACKOFF_SEC must be >= 0.1",
+        "ALERT_DEDUP_COOLDOWN_SEC must be >= 0",
+        "CONNECTOR_MAX_WAIT_SEC must be >= 0",
+    } <= set(result["errors"])
 
 
 def test_run_doctor_reports_warning_for_invalid_alert_webhook_format(monkeypatch):
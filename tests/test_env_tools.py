@@ -6,23 +6,23 @@ from src import env_tools
 def test_ensure_env_from_example_creates_and_adds_keys(tmp_path: Path):
     example = tmp_path / ".env.example"
     target = tmp_path / ".env"
-    example.write_text("A=1\nB=2\n", encoding="utf-8")
+    example.write_bytes(b"A=1\nB=2\n")
 
     result = env_tools.ensure_env_from_example(example_path=example, env_path=target)
     assert result["created"] == 1
     assert result["added"] == 2
-    assert "A=1" in target.read_text(encoding="utf-8")
+    assert b"A=1" in target.read_bytes()
 
 
 def test_ensure_env_from_example_adds_only_missing_keys(tmp_path: Path):
     example = tmp_path / ".env.example"
     target = tmp_path / ".env"
-    example.write_text("A=1\nB=2\n", encoding="utf-8")
-    target.write_text("A=9\n", encoding="utf-8")
+    example.write_bytes(b"A=1\nB=2\n")
+    target.write_bytes(b"A=9\n")
 
     result = env_tools.ensure_env_from_example(example_path=example, env_path=target)
     assert result["created"] == 0
     assert result["added"] == 1
-    text = target.read_text(encoding="utf-8")
-    assert "A=9" in text
-    assert "B=2" in text
+    data = target.read_bytes()
+    assert b"A=9" in data
+    assert b"B=2" in data
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import importlib.util
+import os
+import re
 from pathlib import Path
 
+_SECTION_HEADING_RE = re.compile(r"^## (.+)$", re.MULTILINE)
+
 
 def _load_module():
     script_path = (
@@ -27,7 +31,7 @@ def test_missing_required_files_returns_missing_entries(tmp_path):
     existing_path.parent.mkdir(parents=True, exist_ok=True)
     existing_path.write_text("ok", encoding="utf-8")
 
-    missing = module.missing_required_files(list(module.DEFAULT_REQUIRED_FILES), tmp_path)
+    missing = module.missing_required_files(module.DEFAULT_REQUIRED_FILES, tmp_path)
 
     assert existing not in missing
     assert set(missing) == set(module.DEFAULT_REQUIRED_FILES[1:])
@@ -59,8 +63,6 @@ def test_collect_latest_log_excerpt_reads_newest_log_file(tmp_path):
     new_ts = 1_800_000_000
     old_file.touch()
     latest_file.touch()
-    import os
-
     os.utime(old_file, (old_ts, old_ts))
     os.utime(latest_file, (new_ts, new_ts))
 
@@ -85,11 +87,13 @@ def test_build_diagnostic_markdown_contains_all_required_sections():
         generated_at="2026-03-01T00:00:00+00:00",
     )
 
-    assert "## Executed Commands" in report
-    assert "## Failure Reasons" in report
-    assert "## Reproduction Commands" in report
-    assert "## Required File Verification" in report
-    assert "## Latest Log Excerpt" in report
+    assert {
+        "Executed Commands",
+        "Failure Reasons",
+        "Reproduction Commands",
+        "Required File Verification",
+        "Latest Log Excerpt",
+    } <= set(_SECTION_HEADING_RE.findall(report))
     assert "[MISSING] docs/ops_reports/index.html" in report
 
 
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-import json
-from pathlib import Path
+from datetime import datetime
 
 import pytest
 
+from conftest import FROZEN_NOW, load_schema
+from src import metrics
 from src.metrics import (
     build_metrics_summary,
     calculate_operational_health_score,
@@ -15,62 +15,28 @@ from src.metrics import (
     normalize_health_summary,
     summarize_pipeline_metrics,
 )
-from src.schema_validation import load_json_schema, validate_json_payload
+from src.schema_validation import validate_json_payload
 from src.schema_versions import SCHEMA_VERSION
 
 
-def _write_metric(logs_dir, name: str, payload: dict) -> None:
-    (logs_dir / name).write_text(json.dumps(payload), encoding="utf-8")
+TS_RECENT = FROZEN_NOW.isoformat()
+VIOLATIONS_20_FAILURE_RATE = ({"pipeline": "daily", "metric": "failure_rate"},) * 20
+VIOLATIONS_3_DURATION = ({"pipeline": "daily", "metric": "max_duration_sec"},) * 3
 
 
-def _load_metrics_check_schema() -> dict:
-    return load_json_schema(Path("docs/schemas/metrics_check.schema.json"))
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW
 
 
-def test_summarize_pipeline_metrics_basic(tmp_path):
-    logs_dir = tmp_path / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    now = datetime.now()
+@pytest.fixture(autouse=True)
+def _freeze_metrics_clock(monkeypatch):
+    monkeypatch.setattr(metrics, "datetime", _FrozenDatetime)
 
-    ts1 = (now - timedelta(days=1)).replace(microsecond=0).isoformat()
-    ts2 = now.replace(microsecond=0).isoformat()
 
-    _write_metric(
-        logs_dir,
-        "daily-metrics-20260301-010101.json",
-        {
-            "pipeline": "daily",
-            "finished_at": ts1,
-            "duration_sec": 10,
-            "command_failures": 1,
-            "alert_count": 2,
-            "success": True,
-        },
-    )
-    _write_metric(
-        logs_dir,
-        "daily-metrics-20260301-020202.json",
-        {
-            "pipeline": "daily",
-            "finished_at": ts2,
-            "duration_sec": 20,
-            "command_failures": 0,
-            "alert_count": 1,
-            "success": False,
-        },
-    )
-    _write_metric(
-        logs_dir,
-        "weekly-metrics-20260301-030303.json",
-        {
-            "pipeline": "weekly",
-            "finished_at": ts2,
-            "duration_sec": 30,
-            "command_failures": 2,
-            "alert_count": 3,
-            "success": True,
-        },
-    )
+def test_summarize_pipeline_metrics_basic(metrics_logs_dir):
+    logs_dir = metrics_logs_dir / "basic"
 
     summary = summarize_pipeline_metrics(days=30, logs_dir=logs_dir)
 
@@ -83,7 +49,7 @@ def test_summarize_pipeline_metrics_basic(tmp_path):
     assert daily["success_rate"] == pytest.approx(0.5)
     assert daily["avg_duration_sec"] == pytest.approx(15.0)
     assert daily["max_duration_sec"] == pytest.approx(20.0)
-    assert daily["latest_run"]["timestamp"] == ts2
+    assert daily["latest_run"]["timestamp"] == TS_RECENT
     assert daily["latest_run"]["success"] is False
 
     weekly = summary["pipelines"]["weekly"]
@@ -91,38 +57,8 @@ def test_summarize_pipeline_metrics_basic(tmp_path):
     assert weekly["success_rate"] == pytest.approx(1.0)
 
 
-def test_summarize_pipeline_metrics_days_filter(tmp_path):
-    logs_dir = tmp_path / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    now = datetime.now()
-
-    recent = (now - timedelta(days=1)).replace(microsecond=0).isoformat()
-    old = (now - timedelta(days=40)).replace(microsecond=0).isoformat()
-
-    _write_metric(
-        logs_dir,
-        "monthly-metrics-20260301-040404.json",
-        {
-            "pipeline": "monthly",
-            "finished_at": recent,
-            "duration_sec": 44,
-            "command_failures": 1,
-            "alert_count": 1,
-            "success": True,
-        },
-    )
-    _write_metric(
-        logs_dir,
-        "monthly-metrics-20260101-040404.json",
-        {
-            "pipeline": "monthly",
-            "finished_at": old,
-            "duration_sec": 99,
-            "command_failures": 9,
-            "alert_count": 9,
-            "success": False,
-        },
-    )
+def test_summarize_pipeline_metrics_days_filter(metrics_logs_dir):
+    logs_dir = metrics_logs_dir / "days_filter"
 
     summary = summarize_pipeline_metrics(days=30, logs_dir=logs_dir)
 
@@ -133,63 +69,59 @@ def test_summarize_pipeline_metrics_days_filter(tmp_path):
     assert summary["totals"]["alert_count"] == 1
 
 
-def test_load_metric_thresholds_profile_defaults_and_bounds():
-    thresholds = load_metric_thresholds(
-        {
-            "METRIC_THRESHOLD_PROFILE": "stg",
-            "METRIC_MAX_DURATION_DAILY_SEC": "invalid",
-            "METRIC_MAX_DURATION_WEEKLY_SEC": "0",
-            "METRIC_MAX_FAILURE_RATE_DAILY": "1.5",
-            "METRIC_MAX_FAILURE_RATE_MONTHLY": "-0.2",
-        }
-    )
-
-    assert thresholds["daily"]["max_duration_sec"] == pytest.approx(1200.0)
-    assert thresholds["weekly"]["max_duration_sec"] == pytest.approx(1.0)
-    assert thresholds["daily"]["max_failure_rate"] == pytest.approx(1.0)
-    assert thresholds["monthly"]["max_failure_rate"] == pytest.approx(0.0)
-
-
-def test_load_metric_thresholds_explicit_override_wins_over_profile():
-    thresholds = load_metric_thresholds(
-        {
-            "METRIC_THRESHOLD_PROFILE": "dev",
-            "METRIC_MAX_DURATION_DAILY_SEC": "333",
-            "METRIC_MAX_FAILURE_RATE_DAILY": "0.12",
-        }
-    )
-
-    assert thresholds["daily"]["max_duration_sec"] == pytest.approx(333.0)
-    assert thresholds["daily"]["max_failure_rate"] == pytest.approx(0.12)
-    assert thresholds["weekly"]["max_duration_sec"] == pytest.approx(3600.0)
-    assert thresholds["monthly"]["max_failure_rate"] == pytest.approx(0.50)
-
-
-def test_load_metric_thresholds_unknown_profile_falls_back_to_prod_defaults():
-    thresholds = load_metric_thresholds({"METRIC_THRESHOLD_PROFILE": "qa"})
-
-    assert thresholds["daily"]["max_duration_sec"] == pytest.approx(900.0)
-    assert thresholds["weekly"]["max_duration_sec"] == pytest.approx(1800.0)
-    assert thresholds["monthly"]["max_failure_rate"] == pytest.approx(0.25)
+@pytest.mark.parametrize(
+    "env, expected",
+    [
+        pytest.param(
+            {
+                "METRIC_THRESHOLD_PROFILE": "stg",
+                "METRIC_MAX_DURATION_DAILY_SEC": "invalid",
+                "METRIC_MAX_DURATION_WEEKLY_SEC": "0",
+                "METRIC_MAX_FAILURE_RATE_DAILY": "1.5",
+                "METRIC_MAX_FAILURE_RATE_MONTHLY": "-0.2",
+            },
+            {
+                ("daily", "max_duration_sec"): 1200.0,
+                ("weekly", "max_duration_sec"): 1.0,
+                ("daily", "max_failure_rate"): 1.0,
+                ("monthly", "max_failure_rate"): 0.0,
+            },
+            id="profile-defaults-and-bounds",
+        ),
+        pytest.param(
+            {
+                "METRIC_THRESHOLD_PROFILE": "dev",
+                "METRIC_MAX_DURATION_DAILY_SEC": "333",
+                "METRIC_MAX_FAILURE_RATE_DAILY": "0.12",
+            },
+            {
+                ("daily", "max_duration_sec"): 333.0,
+                ("daily", "max_failure_rate"): 0.12,
+                ("weekly", "max_duration_sec"): 3600.0,
+                ("monthly", "max_failure_rate"): 0.50,
+            },
+            id="explicit-override-wins-over-profile",
+        ),
+        pytest.param(
+            {"METRIC_THRESHOLD_PROFILE": "qa"},
+            {
+                ("daily", "max_duration_sec"): 900.0,
+                ("weekly", "max_duration_sec"): 1800.0,
+                ("monthly", "max_failure_rate"): 0.25,
+            },
+            id="unknown-profile-falls-back-to-prod-defaults",
+        ),
+    ],
+)
+def test_load_metric_thresholds(env, expected):
+    thresholds = load_metric_thresholds(env)
 
+    for (pipeline, key), value in expected.items():
+        assert thresholds[pipeline][key] == pytest.approx(value)
 
-def test_check_metric_thresholds_detects_duration_and_failure_rate(tmp_path):
-    logs_dir = tmp_path / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    now = datetime.now().replace(microsecond=0)
 
-    _write_metric(
-        logs_dir,
-        "daily-metrics-20260301-000001.json",
-        {
-            "pipeline": "daily",
-            "finished_at": now.isoformat(),
-            "duration_sec": 12,
-            "command_failures": 0,
-            "alert_count": 0,
-            "success": False,
-        },
-    )
+def test_check_metric_thresholds_detects_duration_and_failure_rate(metrics_logs_dir):
+    logs_dir = metrics_logs_dir / "daily_failure"
 
     result = check_metric_thresholds(
         days=30,
@@ -206,9 +138,8 @@ def test_check_metric_thresholds_detects_duration_and_failure_rate(tmp_path):
     assert all(item["pipeline"] == "daily" for item in violations)
 
 
-def test_check_metric_thresholds_includes_resolved_profile(tmp_path):
-    logs_dir = tmp_path / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
+def test_check_metric_thresholds_includes_resolved_profile(metrics_logs_dir):
+    logs_dir = metrics_logs_dir / "empty"
 
     result = check_metric_thresholds(
         days=30,
@@ -219,24 +150,8 @@ def test_check_metric_thresholds_includes_resolved_profile(tmp_path):
     assert result["threshold_profile"] == "prod"
 
 
-def test_evaluate_consecutive_slo_alert_detects_pipeline_streak(tmp_path):
-    logs_dir = tmp_path / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    now = datetime.now().replace(microsecond=0)
-
-    for offset in [0, 1, 2]:
-        _write_metric(
-            logs_dir,
-            f"weekly-metrics-20260301-00000{offset}.json",
-            {
-                "pipeline": "weekly",
-                "finished_at": (now - timedelta(hours=offset)).isoformat(),
-                "duration_sec": 10,
-                "command_failures": 1,
-                "alert_count": 1,
-                "success": False,
-            },
-        )
+def test_evaluate_consecutive_slo_alert_detects_pipeline_streak(metrics_logs_dir):
+    logs_dir = metrics_logs_dir / "weekly_streak"
 
     result = evaluate_consecutive_slo_alert(
         days=30,
@@ -253,30 +168,14 @@ def test_evaluate_consecutive_slo_alert_detects_pipeline_streak(tmp_path):
         {
             "pipeline": "weekly",
             "consecutive_failures": 3,
-            "latest_run": now.isoformat(),
+            "latest_run": TS_RECENT,
             "severity": "warning",
         }
     ]
 
 
-def test_evaluate_consecutive_slo_alert_critical_severity(tmp_path):
-    logs_dir = tmp_path / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    now = datetime.now().replace(microsecond=0)
-
-    for offset in [0, 1, 2, 3, 4]:
-        _write_metric(
-            logs_dir,
-            f"daily-metrics-20260301-01010{offset}.json",
-            {
-                "pipeline": "daily",
-                "finished_at": (now - timedelta(hours=offset)).isoformat(),
-                "duration_sec": 8,
-                "command_failures": 1,
-                "alert_count": 1,
-                "success": False,
-            },
-        )
+def test_evaluate_consecutive_slo_alert_critical_severity(metrics_logs_dir):
+    logs_dir = metrics_logs_dir / "daily_streak"
 
     result = evaluate_consecutive_slo_alert(
         days=30,
@@ -318,9 +217,7 @@ def test_calculate_operational_health_score_boundary_worst_case_clamped_to_zero(
         },
         "totals": {"command_failures": 99, "alert_count": 999},
     }
-    violations = [{"pipeline": "daily", "metric": "failure_rate"}] * 20
-
-    health = calculate_operational_health_score(summary=summary, violations=violations)
+    health = calculate_operational_health_score(summary=summary, violations=VIOLATIONS_20_FAILURE_RATE)
 
     assert health["score"] == 0
     assert health["factors"]["violation_count"] == 20
@@ -338,7 +235,7 @@ def test_calculate_operational_health_score_decreases_when_failures_or_violation
     base = calculate_operational_health_score(summary=base_summary, violations=[])
     worse_by_violations = calculate_operational_health_score(
         summary=base_summary,
-        violations=[{"pipeline": "daily", "metric": "max_duration_sec"}] * 3,
+        violations=VIOLATIONS_3_DURATION,
     )
     worse_by_failures = calculate_operational_health_score(
         summary={
@@ -352,23 +249,8 @@ def test_calculate_operational_health_score_decreases_when_failures_or_violation
     assert worse_by_failures["score"] < base["score"]
 
 
-def test_build_metrics_summary_includes_health_score_and_breakdown(tmp_path):
-    logs_dir = tmp_path / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    now = datetime.now().replace(microsecond=0)
-
-    _write_metric(
-        logs_dir,
-        "daily-metrics-20260301-000001.json",
-        {
-            "pipeline": "daily",
-            "finished_at": now.isoformat(),
-            "duration_sec": 12,
-            "command_failures": 1,
-            "alert_count": 2,
-            "success": False,
-        },
-    )
+def test_build_metrics_summary_includes_health_score_and_breakdown(metrics_logs_dir):
+    logs_dir = metrics_logs_dir / "daily_failure_with_alerts"
 
     payload = build_metrics_summary(days=30, logs_dir=logs_dir)
     result = check_metric_thresholds(days=30, logs_dir=logs_dir)
@@ -378,23 +260,8 @@ def test_build_metrics_summary_includes_health_score_and_breakdown(tmp_path):
     assert payload["health_breakdown"] == expected["health_breakdown"]
 
 
-def test_metrics_check_json_payload_conforms_schema(tmp_path):
-    logs_dir = tmp_path / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    now = datetime.now().replace(microsecond=0)
-
-    _write_metric(
-        logs_dir,
-        "daily-metrics-20260301-000001.json",
-        {
-            "pipeline": "daily",
-            "finished_at": now.isoformat(),
-            "duration_sec": 12,
-            "command_failures": 0,
-            "alert_count": 0,
-            "success": False,
-        },
-    )
+def test_metrics_check_json_payload_conforms_schema(metrics_logs_dir):
+    logs_dir = metrics_logs_dir / "daily_failure"
 
     result = check_metric_thresholds(
         days=30,
@@ -412,4 +279,4 @@ def test_metrics_check_json_payload_conforms_schema(tmp_path):
         "continuous_alert": result["continuous_alert"],
     }
 
-    validate_json_payload(payload, _load_metrics_check_schema(), schema_name="metrics_check.schema.json")
+    validate_json_payload(payload, load_schema("metrics_check.schema.json"), schema_name="metrics_check.schema.json")
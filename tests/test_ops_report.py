@@ -1,144 +1,102 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-import json
-from pathlib import Path
 
+import orjson
+import pytest
+
+from conftest import schema_validator
 from src.ops_report import build_ops_report_data, write_ops_report
 from src.ops_report_index import write_ops_reports_index
-from src.schema_validation import load_json_schema, validate_json_payload
 from src.schema_versions import SCHEMA_VERSION
 
 
-def _write_metric(logs_dir, name: str, payload: dict) -> None:
-    (logs_dir / name).write_text(json.dumps(payload), encoding="utf-8")
-
-
-def _load_ops_report_schema() -> dict:
-    return load_json_schema(Path("docs/schemas/ops_report.schema.json"))
-
+OPS_NOW = datetime(2026, 3, 1, 10, 0, 0)
+_RECENT = (OPS_NOW - timedelta(days=1)).isoformat()
+_OLD = (OPS_NOW - timedelta(days=20)).isoformat()
 
-def test_build_ops_report_data_aggregates_metrics_alerts_and_failures(tmp_path):
-    logs_dir = tmp_path / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
 
-    now = datetime(2026, 3, 1, 10, 0, 0)
-    recent = (now - timedelta(days=1)).isoformat()
-    old = (now - timedelta(days=20)).isoformat()
-
-    _write_metric(
-        logs_dir,
-        "daily-metrics-20260301-010101.json",
+def _metric_json(pipeline, finished_at, duration_sec, command_failures, alert_count, success) -> bytes:
+    return orjson.dumps(
         {
-            "pipeline": "daily",
-            "finished_at": recent,
-            "duration_sec": 12,
-            "command_failures": 2,
-            "alert_count": 1,
-            "success": False,
-        },
+            "pipeline": pipeline,
+            "finished_at": finished_at,
+            "duration_sec": duration_sec,
+            "command_failures": command_failures,
+            "alert_count": alert_count,
+            "success": success,
+        }
     )
-    _write_metric(
-        logs_dir,
-        "weekly-metrics-20260301-020202.json",
-        {
-            "pipeline": "weekly",
-            "finished_at": recent,
-            "duration_sec": 20,
-            "command_failures": 1,
-            "alert_count": 2,
-            "success": True,
-        },
-    )
-    _write_metric(
-        logs_dir,
-        "monthly-metrics-20260201-030303.json",
+
+
+def _lines(*lines: str) -> bytes:
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+OPS_REPORT_LOG_FILES = {
+    "daily-metrics-20260301-010101.json": _metric_json("daily", _RECENT, 12, 2, 1, False),
+    "weekly-metrics-20260301-020202.json": _metric_json("weekly", _RECENT, 20, 1, 2, True),
+    "monthly-metrics-20260201-030303.json": _metric_json("monthly", _OLD, 30, 5, 5, True),
+    "alerts.log": _lines(
+        f"[{_RECENT}] WARNING weekly pipeline: command failed: python -m src.main analyze --ai",
+        f"[{_RECENT}] WARNING weekly pipeline: metrics-check reported threshold violations",
+        f"[{_RECENT}] ERROR weekly pipeline: alert webhook final failure after 3 attempts",
+        f"[{_OLD}] WARNING weekly pipeline: command failed: python -m src.main retention",
+    ),
+    "alerts-summary-20260301.md": _lines(
+        "# Alert Summary (Daily)",
+        "",
+        "Generated: 2026-03-01T08:00:00",
+        "- Command failures: 1",
+        "- Alert count: 2",
+        "",
+        "## Alerts",
+        "- [2026-03-01T08:00:00] WARNING daily pipeline: promoted actions below threshold (0 < 1)",
+        "- [2026-03-01T08:05:00] WARNING daily pipeline: metrics-check reported threshold violations",
+    ),
+    "alerts-summary-20260301-weekly.md": b"# weekly\n",
+    "daily-run-20260301-090000.log": _lines(
+        "=== Daily pipeline started: 2026-03-01T09:00:00 ===",
+        ">>> python -m src.main analyze --ai",
+        "[2026-03-01T09:10:00] ERROR daily pipeline: command failed: python -m src.main analyze --ai",
+        ">>> python -m src.main retention",
+        "[2026-03-01T09:12:00] ERROR daily pipeline: command failed: python -m src.main retention",
+    ),
+    "weekly-run-20260301-093000.log": _lines(
+        "=== Weekly pipeline started: 2026-03-01T09:30:00 ===",
+        ">>> python -m src.main ops-report --days 7",
+        "[2026-03-01T09:45:00] ERROR weekly pipeline: command failed: python -m src.main ops-report --days 7",
+    ),
+    "monthly-run-20260201-010101.log": _lines(
+        "[2026-02-01T01:10:00] ERROR monthly pipeline: command failed: python -m src.main retention",
+    ),
+    "weekly-artifact-verify.json": orjson.dumps(
         {
-            "pipeline": "monthly",
-            "finished_at": old,
-            "duration_sec": 30,
-            "command_failures": 5,
-            "alert_count": 5,
-            "success": True,
+            "checks": [
+                {"path": "docs/ops_reports/latest_ops_report.md", "status": "OK"},
+                {"path": "docs/ops_reports/index.html", "status": "MISSING"},
+            ],
+            "summary": {"total": 2, "ok": 1, "missing": 1},
         },
-    )
+        option=orjson.OPT_APPEND_NEWLINE,
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def ops_report_logs(tmp_path_factory):
+    """Write the ops-report log corpus once per session; tests must not modify it."""
+    logs_dir = tmp_path_factory.mktemp("ops_report_logs")
+    for name, blob in OPS_REPORT_LOG_FILES.items():
+        (logs_dir / name).write_bytes(blob)
+    return logs_dir
 
-    (logs_dir / "alerts.log").write_text(
-        "\n".join(
-            [
-                f"[{recent}] WARNING weekly pipeline: command failed: python -m src.main analyze --ai",
-                f"[{recent}] WARNING weekly pipeline: metrics-check reported threshold violations",
-                f"[{recent}] ERROR weekly pipeline: alert webhook final failure after 3 attempts",
-                f"[{old}] WARNING weekly pipeline: command failed: python -m src.main retention",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
-    (logs_dir / "alerts-summary-20260301.md").write_text(
-        "\n".join(
-            [
-                "# Alert Summary (Daily)",
-                "",
-                "Generated: 2026-03-01T08:00:00",
-                "- Command failures: 1",
-                "- Alert count: 2",
-                "",
-                "## Alerts",
-                "- [2026-03-01T08:00:00] WARNING daily pipeline: promoted actions below threshold (0 < 1)",
-                "- [2026-03-01T08:05:00] WARNING daily pipeline: metrics-check reported threshold violations",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
-    (logs_dir / "alerts-summary-20260301-weekly.md").write_text("# weekly\n", encoding="utf-8")
-    (logs_dir / "daily-run-20260301-090000.log").write_text(
-        "\n".join(
-            [
-                "=== Daily pipeline started: 2026-03-01T09:00:00 ===",
-                ">>> python -m src.main analyze --ai",
-                "[2026-03-01T09:10:00] ERROR daily pipeline: command failed: python -m src.main analyze --ai",
-                ">>> python -m src.main retention",
-                "[2026-03-01T09:12:00] ERROR daily pipeline: command failed: python -m src.main retention",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
-    (logs_dir / "weekly-run-20260301-093000.log").write_text(
-        "\n".join(
-            [
-                "=== Weekly pipeline started: 2026-03-01T09:30:00 ===",
-                ">>> python -m src.main ops-report --days 7",
-                "[2026-03-01T09:45:00] ERROR weekly pipeline: command failed: python -m src.main ops-report --days 7",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
-    (logs_dir / "monthly-run-20260201-010101.log").write_text(
-        "[2026-02-01T01:10:00] ERROR monthly pipeline: command failed: python -m src.main retention\n",
-        encoding="utf-8",
-    )
-    (logs_dir / "weekly-artifact-verify.json").write_text(
-        json.dumps(
-            {
-                "checks": [
-                    {"path": "docs/ops_reports/latest_ops_report.md", "status": "OK"},
-                    {"path": "docs/ops_reports/index.html", "status": "MISSING"},
-                ],
-                "summary": {"total": 2, "ok": 1, "missing": 1},
-            }
-        )
-        + "\n",
-        encoding="utf-8",
-    )
 
+def test_build_ops_report_data_aggregates_metrics_alerts_and_failures(ops_report_logs):
     report = build_ops_report_data(
         days=7,
-        logs_dir=logs_dir,
-        now=now,
+        logs_dir=ops_report_logs,
+        now=OPS_NOW,
         env={
             "METRIC_MAX_DURATION_DAILY_SEC": "10",
             "METRIC_MAX_FAILURE_RATE_DAILY": "0.2",
@@ -156,10 +114,7 @@ def test_build_ops_report_data_aggregates_metrics_alerts_and_failures(tmp_path):
     assert report["pipeline_success_rates"]["weekly"]["success_rate"] == 1.0
     assert report["threshold_violations_count"] >= 2
 
-    top_types = {item["type"]: item["count"] for item in report["top_alert_types"]}
-    assert top_types.get("command_failed", 0) == 1
-    assert top_types.get("threshold", 0) == 1
-    assert top_types.get("webhook_failed", 0) == 1
+    assert report["top_alert_type_counts"] == {"command_failed": 1, "threshold": 1, "webhook_failed": 1}
     assert len(report["daily_alert_summaries"]) == 1
     assert report["daily_alert_summaries"][0]["date"] == "2026-03-01"
     assert report["daily_alert_summaries"][0]["command_failures"] == 1
@@ -180,7 +135,7 @@ def test_build_ops_report_data_aggregates_metrics_alerts_and_failures(tmp_path):
     assert guides[0]["suggested_retry_command"] == "python -m src.main ops-report --days 7"
     assert guides[0]["runbook_reference"] == "docs/runbook.md#週次パイプライン"
     assert guides[0]["runbook_reference_anchor"] == "#週次パイプライン"
-    validate_json_payload(report, _load_ops_report_schema(), schema_name="ops_report.schema.json")
+    schema_validator("ops_report.schema.json").validate(report)
 
 
 def test_write_ops_report_creates_markdown_and_html_outputs(tmp_path):
@@ -246,27 +201,30 @@ def test_write_ops_report_creates_markdown_and_html_outputs(tmp_path):
         ],
     }
 
-    report_path = write_ops_report(report, output_dir=tmp_path / "docs" / "ops_reports")
+    out_dir = tmp_path / "docs" / "ops_reports"
+    report_path = write_ops_report(report, output_dir=out_dir)
 
     assert report_path.name == "ops-report-2026-03-01.md"
     assert report_path.exists()
-    assert (tmp_path / "docs" / "ops_reports" / "latest_ops_report.md").exists()
-    assert (tmp_path / "docs" / "ops_reports" / "ops-report-2026-03-01.html").exists()
-    assert (tmp_path / "docs" / "ops_reports" / "latest_ops_report.html").exists()
-    assert (tmp_path / "docs" / "ops_reports" / "index.html").exists()
-
-    text = report_path.read_text(encoding="utf-8")
-    assert "health_score: 88" in text
-    assert "health_breakdown" in text
-    assert "## Daily Alert Summaries" in text
-    assert "2026-03-01: command_failures=1, alert_count=2" in text
-    assert "## Artifact Integrity" in text
-    assert "Summary: ok=3, missing=1, total=4" in text
-    assert "[MISSING] docs/ops_reports/index.html" in text
-    assert "## Failed Command Retry Guide" in text
-    assert "suggested_retry_command: python -m src.main retention" in text
-    assert "runbook_reference: [docs/runbook.md#日次パイプライン](docs/runbook.md#日次パイプライン)" in text
-    assert "runbook_reference_anchor: #日次パイプライン" in text
+    for name in ("latest_ops_report.md", "ops-report-2026-03-01.html", "latest_ops_report.html", "index.html"):
+        assert (out_dir / name).exists(), name
+
+    data = report_path.read_bytes()
+    needles = (
+        "health_score: 88",
+        "health_breakdown",
+        "## Daily Alert Summaries",
+        "2026-03-01: command_failures=1, alert_count=2",
+        "## Artifact Integrity",
+        "Summary: ok=3, missing=1, total=4",
+        "[MISSING] docs/ops_reports/index.html",
+        "## Failed Command Retry Guide",
+        "suggested_retry_command: python -m src.main retention",
+        "runbook_reference: [docs/runbook.md#日次パイプライン](docs/runbook.md#日次パイプライン)",
+        "runbook_reference_anchor: #日次パイプライン",
+    )
+    for needle in needles:
+        assert needle.encode("utf-8") in data, needle
 
 
 def test_write_ops_reports_index_lists_latest_and_recent(tmp_path):
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from src import reflector
 
 
@@ -12,52 +14,37 @@ def test_generate_backlog_markdown():
     assert "## Spotlight Actions" in text
 
 
-def test_write_backlog(tmp_path: Path):
+def _assert_contains_once(content: str, fragments: tuple[str, ...]) -> None:
+    for fragment in fragments:
+        assert content.count(fragment) == 1, fragment
+
+
+@pytest.mark.parametrize(
+    "kwargs, fragments",
+    [
+        pytest.param({}, ("s: 2",), id="summary-only"),
+        pytest.param(
+            {"spotlight_actions": ["Do one", "Do two"]},
+            ("- [ ] Do one", "- [ ] Do two"),
+            id="spotlight-actions",
+        ),
+        pytest.param(
+            {"spotlight_actions": ["[Low] low", "[High] high", "[Med] med"]},
+            ("- [ ] [High] high\n- [ ] [Med] med\n- [ ] [Low] low\n",),
+            id="spotlight-sorted-by-priority",
+        ),
+        pytest.param(
+            {"promoted_actions": ["Promoted X", "Promoted X", "Promoted Y"]},
+            ("## Promoted This Week", "- [ ] Promoted X", "- [ ] Promoted Y"),
+            id="promoted-actions-deduplicated",
+        ),
+    ],
+)
+def test_write_backlog(tmp_path: Path, kwargs, fragments):
     output = tmp_path / "docs" / "improvement_backlog.md"
-    path = reflector.write_backlog({"s": 2}, output_path=output)
+    path = reflector.write_backlog({"s": 2}, output_path=output, **kwargs)
     assert path.exists()
-    assert "s: 2" in path.read_text(encoding="utf-8")
-
-
-def test_write_backlog_with_spotlight_actions(tmp_path: Path):
-    output = tmp_path / "docs" / "improvement_backlog.md"
-    path = reflector.write_backlog(
-        {"s": 2},
-        spotlight_actions=["Do one", "Do two"],
-        output_path=output,
-    )
-    content = path.read_text(encoding="utf-8")
-    assert "- [ ] Do one" in content
-    assert "- [ ] Do two" in content
-
-
-def test_write_backlog_with_spotlight_actions_sorted_by_priority(tmp_path: Path):
-    output = tmp_path / "docs" / "improvement_backlog.md"
-    path = reflector.write_backlog(
-        {"s": 2},
-        spotlight_actions=["[Low] low", "[High] high", "[Med] med"],
-        output_path=output,
-    )
-    lines = path.read_text(encoding="utf-8").splitlines()
-    spotlight_lines = [line for line in lines if line.startswith("- [ ] [")]
-    assert spotlight_lines[:3] == [
-        "- [ ] [High] high",
-        "- [ ] [Med] med",
-        "- [ ] [Low] low",
-    ]
-
-
-def test_write_backlog_with_promoted_actions(tmp_path: Path):
-    output = tmp_path / "docs" / "improvement_backlog.md"
-    path = reflector.write_backlog(
-        {"s": 2},
-        promoted_actions=["Promoted X", "Promoted X", "Promoted Y"],
-        output_path=output,
-    )
-    content = path.read_text(encoding="utf-8")
-    assert "## Promoted This Week" in content
-    assert content.count("- [ ] Promoted X") == 1
-    assert "- [ ] Promoted Y" in content
+    _assert_contains_once(path.read_text(encoding="utf-8"), fragments)
 
 
 def test_update_instruction_file(tmp_path: Path):
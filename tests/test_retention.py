@@ -1,31 +1,37 @@
 import json
-from datetime import datetime, timedelta
+from datetime import datetime
 import os
+import time
+
+import orjson
 
 from src.retention import run_retention
 
 
+# One reference instant for every timestamp the module builds.
+_NOW_TS = time.time()
+
+
 def _iso_days_ago(days: int) -> str:
-    return (datetime.now() - timedelta(days=days)).isoformat(timespec="seconds")
+    return datetime.fromtimestamp(_NOW_TS - days * 86400).isoformat(timespec="seconds")
 
 
 def test_run_retention_moves_old_entries_and_rewrites_files(monkeypatch, tmp_path):
-    monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("RETENTION_DAYS", "90")
 
     collected = [
         {"source": "old", "content": "x", "collected_at": _iso_days_ago(120)},
         {"source": "new", "content": "y", "collected_at": _iso_days_ago(5)},
     ]
-    (tmp_path / "collected_data.json").write_text(json.dumps(collected, ensure_ascii=False), encoding="utf-8")
+    (tmp_path / "collected_data.json").write_bytes(orjson.dumps(collected))
 
     logs_dir = tmp_path / "logs"
     logs_dir.mkdir(parents=True, exist_ok=True)
-    activity_lines = [
-        json.dumps({"timestamp": _iso_days_ago(130), "event": "old"}, ensure_ascii=False),
-        json.dumps({"timestamp": _iso_days_ago(1), "event": "new"}, ensure_ascii=False),
+    activity_rows = [
+        {"timestamp": _iso_days_ago(130), "event": "old"},
+        {"timestamp": _iso_days_ago(1), "event": "new"},
     ]
-    (logs_dir / "activity_history.jsonl").write_text("\n".join(activity_lines) + "\n", encoding="utf-8")
+    (logs_dir / "activity_history.jsonl").write_text("\n".join(map(json.dumps, activity_rows)) + "\n", encoding="utf-8")
 
     alert_lines = [
         f"[{_iso_days_ago(150)}] WARNING old alert",
@@ -36,13 +42,13 @@ def test_run_retention_moves_old_entries_and_rewrites_files(monkeypatch, tmp_pat
 
     old_metrics_path = logs_dir / "daily-metrics-20200101-000000.json"
     old_metrics_path.write_text('{"pipeline":"daily","success":true}', encoding="utf-8")
-    old_timestamp = (datetime.now() - timedelta(days=150)).timestamp()
+    old_timestamp = _NOW_TS - 150 * 86400
     os.utime(old_metrics_path, (old_timestamp, old_timestamp))
 
     recent_metrics_path = logs_dir / "weekly-metrics-20991231-235959.json"
     recent_metrics_path.write_text('{"pipeline":"weekly","success":true}', encoding="utf-8")
 
-    result = run_retention()
+    result = run_retention(base_dir=tmp_path)
 
     assert result["collected_data"]["moved"] == 1
     assert result["collected_data"]["kept"] == 1
@@ -77,9 +83,20 @@ def test_run_retention_moves_old_entries_and_rewrites_files(monkeypatch, tmp_pat
 
 
 def test_run_retention_uses_default_when_env_invalid(monkeypatch, tmp_path):
-    monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("RETENTION_DAYS", "not-a-number")
     (tmp_path / "collected_data.json").write_text("[]", encoding="utf-8")
 
-    result = run_retention()
+    result = run_retention(base_dir=tmp_path)
     assert result["retention_days"] == 90
+
+
+def test_run_retention_only_considers_metrics_json_files(monkeypatch, tmp_path):
+    monkeypatch.setenv("RETENTION_DAYS", "90")
+    logs_dir = tmp_path / "logs"
+    (logs_dir / "daily-metrics-dir.json").mkdir(parents=True)
+    for name in ("daily-metrics-20200101-000000.json", "daily-metrics-20200101.log", "metrics.json"):
+        (logs_dir / name).write_text("{}", encoding="utf-8")
+
+    result = run_retention(base_dir=tmp_path)
+
+    assert result["metrics"] == {"moved": 0, "kept": 1}
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import importlib.util
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def _load_module():
     script_path = Path(__file__).resolve().parents[1] / "scripts" / "ci" / "scan_secrets.py"
     spec = importlib.util.spec_from_file_location("scan_secrets", script_path)
@@ -35,3 +37,20 @@ def test_scan_paths_ignores_placeholder_values(tmp_path):
     findings = module.scan_paths([placeholder_file], tmp_path)
 
     assert findings == []
+
+
+def test_scan_paths_reports_each_pattern_matched_on_a_line(tmp_path):
+    module = _load_module()
+
+    secret_file = tmp_path / "sample.txt"
+    # Assembled at runtime so this test file does not trip the scanner itself.
+    openai_key = "sk-" + "1" * 25
+    aws_key = "AKIA" + "B" * 16
+    secret_file.write_text(f"clean line\nkeys: {openai_key} {aws_key}\n", encoding="utf-8")
+
+    findings = module.scan_paths([secret_file], tmp_path)
+
+    assert [(item["line"], item["pattern"]) for item in findings] == [
+        (2, "openai_api_key"),
+        (2, "aws_access_key"),
+    ]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from src.schema_validation import validate_schema_version_compatibility
+from src.schema_validation import validate_json_payload, validate_schema_version_compatibility
 
 
 def test_schema_version_compatibility_passes_when_major_matches() -> None:
@@ -28,3 +28,17 @@ def test_schema_version_compatibility_fails_when_major_mismatches() -> None:
 
     with pytest.raises(ValueError, match="major version mismatch"):
         validate_schema_version_compatibility(payload, schema, compatibility_level="major")
+
+
+def test_validate_json_payload_reports_error_at_smallest_path() -> None:
+    schema = {
+        "type": "object",
+        "properties": {
+            "files": {"type": "array", "items": {"type": "string"}},
+            "count": {"type": "integer"},
+        },
+    }
+    payload = {"files": ["ok", 1, 2], "count": "x"}
+
+    with pytest.raises(ValueError, match=r"at count: 'x' is not of type 'integer'"):
+        validate_json_payload(payload, schema)